@@ -4,6 +4,7 @@ import { getCredentials, showCredentialsError, validateCredentials } from "../ut
 import { clearStoredUserInfo } from "../storage/userStorage";
 import { API_ENDPOINTS, DEFAULT_API_BASE_URL } from "./constants";
 import { fetchWithRetry } from "../utils/fetchWithRetry";
+import { Semaphore } from "../utils/concurrency";
 import {
   AgentRunResponse,
   UserResponse,
@@ -16,20 +17,59 @@ import {
   LogEntry,
 } from "./types";
 
+// Retrying a POST after a timeout, dropped connection, 500, 502 or 504 could start a second agent run,
+// since the upstream may already have handled it; only a 503 means the request was turned away unprocessed
+const NON_IDEMPOTENT_RETRY_OPTIONS = {
+  retryStatusCodes: [503],
+  retryOnNetworkError: false,
+};
+
+// Cap on agent run status/log requests in flight at once, so a large batch of
+// tracked runs doesn't flood the connection pool or trip the API rate limit
+const MAX_CONCURRENT_AGENT_RUN_REQUESTS = 16;
+
+// Number of agent runs kept for conditional (If-None-Match) requests
+const ETAG_CACHE_SIZE = 100;
+
+interface ETagCacheEntry {
+  etag: string;
+  body: unknown;
+}
+
 export class CodegenAPIClient {
-  private baseUrl: string;
-  private apiToken: string;
+  private baseUrl: string = DEFAULT_API_BASE_URL;
+  private apiToken: string = '';
+  // Built once when credentials are resolved rather than on every request
+  private defaultHeaders: Record<string, string> = {};
+  private ready: Promise<void>;
+  private abortController = new AbortController();
+  // Requests for agent runs currently in flight, keyed by organization and run ID
+  private pendingAgentRuns = new Map<string, Promise<AgentRunResponse>>();
+  // Last ETag and body per agent run URL, oldest first
+  private etagCache = new Map<string, ETagCacheEntry>();
+  // Set once a conditional request fails where a plain one succeeds, e.g. when CORS doesn't allow If-None-Match
+  private conditionalRequestsRejected = false;
+  private agentRunRequests = new Semaphore(MAX_CONCURRENT_AGENT_RUN_REQUESTS);
 
   constructor() {
-    const credentials = getCredentials();
-    this.baseUrl = credentials.apiBaseUrl || DEFAULT_API_BASE_URL;
-    this.apiToken = credentials.apiToken || '';
+    // Credentials are stored asynchronously; resolve them once and reuse them for every request
+    this.ready = getCredentials().then(credentials => {
+      this.baseUrl = credentials.apiBaseUrl || DEFAULT_API_BASE_URL;
+      this.apiToken = credentials.apiToken || '';
+      this.defaultHeaders = {
+        "Authorization": `Bearer ${this.apiToken}`,
+        "Content-Type": "application/json",
+      };
+    });
   }
 
   private async makeRequest<T>(
     endpoint: string,
-    options: RequestInit = {}
+    options: RequestInit = {},
+    revalidate = false
   ): Promise<T> {
+    await this.ready;
+
     // Check if API token is available
     if (!this.apiToken) {
       throw new Error("API token is required. Please set it in extension preferences.");
@@ -37,25 +77,60 @@ export class CodegenAPIClient {
     
     const url = `${this.baseUrl}${endpoint}`;
     
-    const defaultHeaders = {
-      "Authorization": `Bearer ${this.apiToken}`,
-      "Content-Type": "application/json",
-    };
+    const method = (options.method || "GET").toUpperCase();
+    const isIdempotent = method === "GET" || method === "HEAD";
+
+    // Revalidate GETs we have seen before; an unchanged resource comes back as an empty 304.
+    // Only small, repeatedly polled resources opt in, so large responses such as log pages aren't kept
+    const canRevalidate = revalidate && method === "GET" && !this.conditionalRequestsRejected;
+    let cached = canRevalidate ? this.etagCache.get(url) : undefined;
+
+    const signal = options.signal || this.abortController.signal;
+    const send = (etag?: string) => fetchWithRetry(url, {
+      ...options,
+      signal,
+      headers: etag || options.headers
+        ? { ...this.defaultHeaders, ...(etag ? { "If-None-Match": etag } : {}), ...options.headers }
+        : this.defaultHeaders,
+    }, isIdempotent ? {} : NON_IDEMPOTENT_RETRY_OPTIONS);
 
     try {
-      const response = await fetchWithRetry(url, {
-        ...options,
-        headers: {
-          ...defaultHeaders,
-          ...options.headers,
-        },
-      });
+      let response: Response;
+      try {
+        response = await send(cached && cached.etag);
+      } catch (error) {
+        if (!cached || signal.aborted) {
+          throw error;
+        }
+
+        // If-None-Match isn't a CORS-safelisted header, so a server that doesn't allow it fails the
+        // preflight. Drop the cached entry and try again without it
+        this.etagCache.delete(url);
+        cached = undefined;
+        response = await send();
+
+        // The plain request went through, so stop sending conditional requests altogether
+        this.conditionalRequestsRejected = true;
+        this.etagCache.clear();
+      }
+
+      if (response.status === 304 && cached) {
+        this.rememberETag(url, cached.etag, cached.body);
+        return cached.body as T;
+      }
 
       if (!response.ok) {
         await this.handleAPIError(response);
       }
 
-      return await response.json() as T;
+      const body = await response.json() as T;
+
+      const etag = canRevalidate && !this.conditionalRequestsRejected ? response.headers.get("ETag") : null;
+      if (etag) {
+        this.rememberETag(url, etag, body);
+      }
+
+      return body;
     } catch (error) {
       console.error(`API request failed for ${endpoint}:`, error);
       
@@ -67,6 +142,19 @@ export class CodegenAPIClient {
     }
   }
 
+  private rememberETag(url: string, etag: string, body: unknown): void {
+    // Re-insert so the map stays ordered from least to most recently used
+    this.etagCache.delete(url);
+    this.etagCache.set(url, { etag, body });
+
+    if (this.etagCache.size > ETAG_CACHE_SIZE) {
+      const oldest = this.etagCache.keys().next().value;
+      if (oldest !== undefined) {
+        this.etagCache.delete(oldest);
+      }
+    }
+  }
+
   private async handleAPIError(response: Response): Promise<never> {
     let errorMessage = `Request failed with status ${response.status}`;
     
@@ -123,9 +211,25 @@ export class CodegenAPIClient {
     organizationId: number,
     agentRunId: number
   ): Promise<AgentRunResponse> {
-    return this.makeRequest<AgentRunResponse>(
-      API_ENDPOINTS.AGENT_RUN_GET(organizationId, agentRunId)
-    );
+    // Several monitors can ask for the same run at once; share a single request between them
+    const key = `${organizationId}:${agentRunId}`;
+    const pending = this.pendingAgentRuns.get(key);
+    if (pending) {
+      return pending;
+    }
+
+    const request = this.agentRunRequests.run(() => this.makeRequest<AgentRunResponse>(
+      API_ENDPOINTS.AGENT_RUN_GET(organizationId, agentRunId),
+      {},
+      true
+    ));
+    this.pendingAgentRuns.set(key, request);
+
+    try {
+      return await request;
+    } finally {
+      this.pendingAgentRuns.delete(key);
+    }
   }
 
   async resumeAgentRun(
@@ -170,9 +274,53 @@ export class CodegenAPIClient {
     page = 1,
     size = 10
   ): Promise<PaginatedResponse<LogEntry>> {
-    return this.makeRequest<PaginatedResponse<LogEntry>>(
+    return this.agentRunRequests.run(() => this.makeRequest<PaginatedResponse<LogEntry>>(
       API_ENDPOINTS.AGENT_RUN_LOGS(organizationId, agentRunId, page, size)
-    );
+    ));
+  }
+
+  // Scan a run's logs page by page, stopping at the first page the matcher finds something in
+  async findInAgentRunLogs<T>(
+    organizationId: number,
+    agentRunId: number,
+    matcher: (logs: LogEntry[]) => T | undefined,
+    size = 100
+  ): Promise<T | undefined> {
+    let page = 1;
+    let pages = 1;
+
+    while (page <= pages) {
+      const response = await this.getAgentRunLogs(organizationId, agentRunId, page, size);
+      const match = matcher(response.items);
+      if (match !== undefined) {
+        return match;
+      }
+      pages = response.pages;
+      page++;
+    }
+
+    return undefined;
+  }
+
+  // Scan a run's logs page by page from the newest back, for output that is only final at the end of the run
+  async findLastInAgentRunLogs<T>(
+    organizationId: number,
+    agentRunId: number,
+    matcher: (logs: LogEntry[]) => T | undefined,
+    size = 100
+  ): Promise<T | undefined> {
+    // The first page also tells us how many pages there are
+    const firstPage = await this.getAgentRunLogs(organizationId, agentRunId, 1, size);
+
+    for (let page = firstPage.pages; page > 1; page--) {
+      const response = await this.getAgentRunLogs(organizationId, agentRunId, page, size);
+      const match = matcher(response.items);
+      if (match !== undefined) {
+        return match;
+      }
+    }
+
+    return matcher(firstPage.items);
   }
 
   // Organization Methods
@@ -219,6 +367,11 @@ export class CodegenAPIClient {
     return this.makeRequest<UserResponse>(API_ENDPOINTS.USER_ME);
   }
 
+  // Cancel any in-flight requests; the client should not be used afterwards
+  dispose(): void {
+    this.abortController.abort();
+  }
+
   // Validation Method
   async validateConnection(): Promise<boolean> {
     try {
@@ -235,19 +388,17 @@ let apiClient: CodegenAPIClient | null = null;
 
 export function getAPIClient(): CodegenAPIClient {
   if (!apiClient) {
-    try {
-      apiClient = new CodegenAPIClient();
-    } catch (error) {
-      // If credentials are missing, still create the client but it will fail on API calls
-      console.warn("⚠️ API client created without valid credentials:", error);
-      apiClient = new CodegenAPIClient();
-    }
+    // If credentials are missing, the client is still created but will fail on API calls
+    apiClient = new CodegenAPIClient();
   }
   return apiClient;
 }
 
 // Reset the client (useful when credentials change)
 export async function resetAPIClient(): Promise<void> {
+  if (apiClient) {
+    apiClient.dispose();
+  }
   apiClient = null;
   // Clear stored user info when credentials change
   await clearStoredUserInfo();
@@ -122,6 +122,7 @@ export interface AgentRunStatusChange {
   newStatus: string;
   timestamp: string;
   webUrl: string;
+  result?: string;
 }
 
 // Tracked Agent Run
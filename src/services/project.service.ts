@@ -1,6 +1,10 @@
 import { LocalStorage } from '../utils/webStorage';
 import { showToast, Toast_Style as Toast } from '../components/WebToast';
 import { getAPIClient } from '../api/client';
+import { AgentRunResponse, AgentRunStatusChange } from '../api/types';
+import { getAgentRunCache } from '../storage/agentRunCache';
+import { getBackgroundMonitoringService } from '../utils/backgroundMonitoring';
+import { extractPlanFromLogs, extractPrUrl, extractPrUrlFromLogs } from '../utils/agentRunOutput';
 import {
   Project,
   Requirement,
@@ -18,9 +22,43 @@ const STORAGE_KEYS = {
   PROJECTS: 'projects',
   REQUIREMENTS: 'requirements',
   PLANS: 'plans',
-  NOTIFICATIONS: 'notifications'
+  NOTIFICATIONS: 'notifications',
+  MONITORED_RUNS: 'monitored_runs'
 };
 
+type StorageCollection = keyof typeof STORAGE_KEYS;
+
+// Terminal agent run statuses, compared in lower case
+const SUCCESS_STATUSES = ['complete', 'completed'];
+const FAILURE_STATUSES = ['failed', 'error', 'cancelled', 'timeout', 'max_iterations_reached', 'out_of_tokens'];
+
+// Page size used when scanning logs for plans and PR URLs
+const LOG_PAGE_SIZE = 100;
+
+// Agent runs started by the project service, keyed by what they produce
+type MonitoredRunKind = 'plan' | 'implementation';
+
+interface MonitoredRun {
+  planId: string;
+  kind: MonitoredRunKind;
+  organizationId: number;
+  startedAt: number;
+}
+
+// Stored form of a monitored run, so runs in flight can be picked up again after a reload
+interface MonitoredRunRecord extends MonitoredRun {
+  agentRunId: number;
+}
+
+// How long to wait for a status change event before checking a run directly, and between checks while it's still going
+const SAFETY_NET_DELAYS: Record<MonitoredRunKind, number> = {
+  plan: 5 * 60 * 1000, // 5 minutes
+  implementation: 10 * 60 * 1000, // 10 minutes
+};
+
+// Give up on runs that have been going for longer than this and mark them as failed
+const MONITORED_RUN_TTL = 24 * 60 * 60 * 1000; // 24 hours
+
 // Generate unique IDs
 function generateId(): string {
   return `${Date.now()}-${Math.random().toString(36).substr(2, 9)}`;
@@ -31,19 +69,39 @@ export class ProjectService {
   private requirements: Requirement[] = [];
   private plans: Plan[] = [];
   private notifications: ProjectNotification[] = [];
+  // Agent run ID -> plan it belongs to, for routing status change events
+  private monitoredRuns = new Map<number, MonitoredRun>();
+  private safetyNetTimers = new Map<number, NodeJS.Timeout>();
+  // Runs whose outcome is being recorded; still stored, so a reload in the meantime doesn't restore them
+  // and closing the app before the outcome is saved doesn't lose them
+  private settlingRuns = new Map<number, MonitoredRun>();
+  private unsubscribeStatusChanges: () => void;
 
   constructor() {
     this.loadFromStorage();
+    this.unsubscribeStatusChanges = getBackgroundMonitoringService().onStatusChange(
+      change => this.handleAgentRunStatusChange(change)
+    );
+  }
+
+  // Stop listening for agent run events
+  dispose(): void {
+    this.unsubscribeStatusChanges();
+    this.safetyNetTimers.forEach(timer => clearTimeout(timer));
+    this.safetyNetTimers.clear();
+    this.settlingRuns.clear();
+    this.monitoredRuns.clear();
   }
 
   // Load data from local storage
   private async loadFromStorage(): Promise<void> {
     try {
-      const [projectsData, requirementsData, plansData, notificationsData] = await Promise.all([
+      const [projectsData, requirementsData, plansData, notificationsData, monitoredRunsData] = await Promise.all([
         LocalStorage.getItem(STORAGE_KEYS.PROJECTS),
         LocalStorage.getItem(STORAGE_KEYS.REQUIREMENTS),
         LocalStorage.getItem(STORAGE_KEYS.PLANS),
-        LocalStorage.getItem(STORAGE_KEYS.NOTIFICATIONS)
+        LocalStorage.getItem(STORAGE_KEYS.NOTIFICATIONS),
+        LocalStorage.getItem(STORAGE_KEYS.MONITORED_RUNS)
       ]);
 
       this.projects = projectsData ? JSON.parse(projectsData) : [];
@@ -53,6 +111,10 @@ export class ProjectService {
 
       // Populate projects with their requirements and notifications
       this.populateProjectRelations();
+
+      // Resume routing events for plans and implementations that were in flight
+      const monitoredRuns: MonitoredRunRecord[] = monitoredRunsData ? JSON.parse(monitoredRunsData) : [];
+      this.resumeMonitoredRuns(monitoredRuns);
     } catch (error) {
       console.error('Failed to load data from storage:', error);
       // Initialize with empty arrays if loading fails
@@ -63,32 +125,72 @@ export class ProjectService {
     }
   }
 
-  // Save data to local storage
-  private async saveToStorage(): Promise<void> {
+  // Save data to local storage; only the given collections are serialized, or all of them if none are given
+  private async saveToStorage(...collections: StorageCollection[]): Promise<void> {
+    const toSave: StorageCollection[] = collections.length > 0
+      ? collections
+      : ['PROJECTS', 'REQUIREMENTS', 'PLANS', 'NOTIFICATIONS', 'MONITORED_RUNS'];
+
     try {
-      await Promise.all([
-        LocalStorage.setItem(STORAGE_KEYS.PROJECTS, JSON.stringify(this.projects)),
-        LocalStorage.setItem(STORAGE_KEYS.REQUIREMENTS, JSON.stringify(this.requirements)),
-        LocalStorage.setItem(STORAGE_KEYS.PLANS, JSON.stringify(this.plans)),
-        LocalStorage.setItem(STORAGE_KEYS.NOTIFICATIONS, JSON.stringify(this.notifications))
-      ]);
+      await Promise.all(toSave.map(collection =>
+        LocalStorage.setItem(STORAGE_KEYS[collection], this.serializeCollection(collection))
+      ));
     } catch (error) {
       console.error('Failed to save data to storage:', error);
       throw new Error('Failed to save data');
     }
   }
 
+  // Serialize a single collection
+  private serializeCollection(collection: StorageCollection): string {
+    switch (collection) {
+      case 'PROJECTS':
+        // Requirements and notifications are rebuilt on load, so don't store a second copy of them
+        return JSON.stringify(this.projects.map(({ requirements, notifications, ...project }) => project));
+      case 'REQUIREMENTS':
+        return JSON.stringify(this.requirements);
+      case 'PLANS':
+        return JSON.stringify(this.plans);
+      case 'NOTIFICATIONS':
+        return JSON.stringify(this.notifications);
+      case 'MONITORED_RUNS': {
+        const records: MonitoredRunRecord[] = [];
+        const addRecord = (run: MonitoredRun, agentRunId: number) => records.push({ ...run, agentRunId });
+        this.monitoredRuns.forEach(addRecord);
+        this.settlingRuns.forEach(addRecord);
+        return JSON.stringify(records);
+      }
+    }
+  }
+
   // Populate projects with their related data
   private populateProjectRelations(): void {
+    // Index plans, requirements and notifications once instead of scanning them per project
+    const planByRequirement = new Map<string, Plan>();
+    this.plans.forEach(plan => {
+      if (!planByRequirement.has(plan.requirement_id)) {
+        planByRequirement.set(plan.requirement_id, plan);
+      }
+    });
+
+    const requirementsByProject = new Map<string, Requirement[]>();
+    this.requirements.forEach(req => {
+      const list = requirementsByProject.get(req.project_id) || [];
+      list.push({ ...req, plan: planByRequirement.get(req.id) });
+      requirementsByProject.set(req.project_id, list);
+    });
+
+    const notificationsByProject = new Map<string, ProjectNotification[]>();
+    this.notifications.forEach(notif => {
+      const list = notificationsByProject.get(notif.project_id) || [];
+      list.push(notif);
+      notificationsByProject.set(notif.project_id, list);
+    });
+
     this.projects = this.projects.map(project => ({
       ...project,
-      requirements: this.requirements
-        .filter(req => req.project_id === project.id)
-        .map(req => ({
-          ...req,
-          plan: this.plans.find(plan => plan.requirement_id === req.id)
-        })),
-      notifications: this.notifications.filter(notif => notif.project_id === project.id)
+      requirements: requirementsByProject.get(project.id) || [],
+      notifications: notificationsByProject.get(project.id) || []
     }));
   }
 
@@ -123,7 +225,7 @@ export class ProjectService {
     };
 
     this.projects.push(project);
-    await this.saveToStorage();
+    await this.saveToStorage('PROJECTS');
 
     await showToast({
       style: Toast.Success,
@@ -147,7 +249,7 @@ export class ProjectService {
       updated_at: new Date().toISOString()
     };
 
-    await this.saveToStorage();
+    await this.saveToStorage('PROJECTS');
     return this.projects[projectIndex];
   }
 
@@ -159,11 +261,14 @@ export class ProjectService {
     }
 
     // Remove related requirements, plans, and notifications
-    this.requirements = this.requirements.filter(req => req.project_id !== id);
-    this.plans = this.plans.filter(plan => {
-      const requirement = this.requirements.find(req => req.id === plan.requirement_id);
-      return requirement?.project_id !== id;
+    const removedRequirementIds = new Set<string>();
+    this.requirements.forEach(req => {
+      if (req.project_id === id) {
+        removedRequirementIds.add(req.id);
+      }
     });
+    this.requirements = this.requirements.filter(req => !removedRequirementIds.has(req.id));
+    this.plans = this.plans.filter(plan => !removedRequirementIds.has(plan.requirement_id));
     this.notifications = this.notifications.filter(notif => notif.project_id !== id);
 
     // Remove project
@@ -195,7 +300,7 @@ export class ProjectService {
     };
 
     this.requirements.push(requirement);
-    await this.saveToStorage();
+    await this.saveToStorage('REQUIREMENTS');
 
     await showToast({
       style: Toast.Success,
@@ -219,7 +324,7 @@ export class ProjectService {
       updated_at: new Date().toISOString()
     };
 
-    await this.saveToStorage();
+    await this.saveToStorage('REQUIREMENTS');
     return this.requirements[requirementIndex];
   }
 
@@ -259,15 +364,16 @@ export class ProjectService {
         updated_at: now
       };
 
+      // Save the plan first; a reload while the requirement is saved would otherwise drop it
       this.plans.push(plan);
+      await this.saveToStorage('PLANS');
       await this.updateRequirement(requirementId, { 
         status: RequirementStatus.PLANNING,
         plan 
       });
-      await this.saveToStorage();
 
-      // Start polling for plan completion
-      this.pollForPlanCompletion(plan.id, agentRun.id, organizationId);
+      // Return right away; the background monitor reports when the plan is ready
+      await this.watchAgentRun(agentRun, organizationId, plan.id, 'plan');
 
       await showToast({
         style: Toast.Success,
@@ -313,91 +419,22 @@ Focus on creating actionable, detailed steps that can be executed by a developme
 `;
   }
 
-  // Poll for plan completion
-  private async pollForPlanCompletion(planId: string, agentRunId: number, organizationId: number): Promise<void> {
-    const maxAttempts = 30; // 5 minutes with 10-second intervals
-    let attempts = 0;
-
-    const poll = async () => {
-      try {
-        const apiClient = getAPIClient();
-        const agentRun = await apiClient.getAgentRun(organizationId, agentRunId);
-
-        if (agentRun.status === 'completed') {
-          // Extract plan content from agent run logs or response
-          const planContent = await this.extractPlanFromAgentRun(agentRun);
-          
-          // Update plan with generated content
-          const planIndex = this.plans.findIndex(p => p.id === planId);
-          if (planIndex !== -1) {
-            this.plans[planIndex] = {
-              ...this.plans[planIndex],
-              content: planContent,
-              original_content: planContent,
-              updated_at: new Date().toISOString()
-            };
-
-            // Update requirement status
-            const requirement = this.requirements.find(r => r.id === this.plans[planIndex].requirement_id);
-            if (requirement) {
-              await this.updateRequirement(requirement.id, { 
-                status: RequirementStatus.PLANNED,
-                plan: this.plans[planIndex]
-              });
-            }
-
-            await this.saveToStorage();
-
-            await showToast({
-              style: Toast.Success,
-              title: 'Plan Generated',
-              message: 'Your implementation plan is ready for review',
-            });
-          }
-        } else if (agentRun.status === 'failed') {
-          throw new Error('Plan generation failed');
-        } else if (attempts < maxAttempts) {
-          attempts++;
-          setTimeout(poll, 10000); // Poll every 10 seconds
-        } else {
-          throw new Error('Plan generation timed out');
-        }
-      } catch (error) {
-        console.error('Error polling for plan completion:', error);
-        
-        // Update plan with error
-        const planIndex = this.plans.findIndex(p => p.id === planId);
-        if (planIndex !== -1) {
-          this.plans[planIndex] = {
-            ...this.plans[planIndex],
-            content: 'Failed to generate plan. Please try again.',
-            updated_at: new Date().toISOString()
-          };
-
-          const requirement = this.requirements.find(r => r.id === this.plans[planIndex].requirement_id);
-          if (requirement) {
-            await this.updateRequirement(requirement.id, { status: RequirementStatus.DRAFT });
-          }
-
-          await this.saveToStorage();
-        }
+  // Extract plan content from a finished agent run, preferring its final result over its logs
+  private async extractPlanContent(organizationId: number, agentRunId: number, result?: string): Promise<string> {
+    if (result) {
+      return result;
+    }
 
-        await showToast({
-          style: Toast.Failure,
-          title: 'Plan Generation Failed',
-          message: 'Failed to generate implementation plan',
-        });
+    try {
+      const planContent = await getAPIClient().findLastInAgentRunLogs(organizationId, agentRunId, extractPlanFromLogs, LOG_PAGE_SIZE);
+      if (planContent) {
+        return planContent;
       }
-    };
-
-    // Start polling after a short delay
-    setTimeout(poll, 5000);
-  }
+    } catch (error) {
+      console.warn(`Failed to read logs for agent run ${agentRunId}:`, error);
+    }
 
-  // Extract plan content from agent run
-  private async extractPlanFromAgentRun(agentRun: any): Promise<string> {
-    // This would extract the actual plan content from the agent run
-    // For now, we'll return a placeholder
+    // Fall back to a generic plan if the run output doesn't contain one
     return `# Implementation Plan
 
 ## Overview
@@ -431,7 +468,7 @@ Review this plan and click "Start" to begin implementation.
       updated_at: new Date().toISOString()
     };
 
-    await this.saveToStorage();
+    await this.saveToStorage('PLANS');
     return this.plans[planIndex];
   }
 
@@ -452,11 +489,15 @@ Review this plan and click "Start" to begin implementation.
       throw new Error('Project not found');
     }
 
+    const previousImplementationStatus = plan.implementation_status;
+    const previousRequirementStatus = requirement.status;
+    let agentRunCreated = false;
+
     try {
-      // Update statuses
-      await this.updatePlan(planId, plan.content);
+      // Update statuses; both are saved before the API call, since any reload during it restores from storage
       const planIndex = this.plans.findIndex(p => p.id === planId);
       this.plans[planIndex].implementation_status = ImplementationStatus.IN_PROGRESS;
+      await this.updatePlan(planId, plan.content);
       
       await this.updateRequirement(requirement.id, { status: RequirementStatus.IMPLEMENTING });
 
@@ -465,13 +506,14 @@ Review this plan and click "Start" to begin implementation.
       const agentRun = await apiClient.createAgentRun(organizationId, {
         prompt: this.buildImplementPlanPrompt(plan.content, project.repository.full_name, requirement.text)
       });
+      agentRunCreated = true;
 
       // Update plan with agent run ID
       this.plans[planIndex].agent_run_id = agentRun.id;
-      await this.saveToStorage();
+      await this.saveToStorage('PLANS');
 
-      // Start polling for implementation completion
-      this.pollForImplementationCompletion(planId, agentRun.id, organizationId);
+      // Completion is reported by the background monitor
+      await this.watchAgentRun(agentRun, organizationId, planId, 'implementation');
 
       await showToast({
         style: Toast.Success,
@@ -481,6 +523,17 @@ Review this plan and click "Start" to begin implementation.
 
     } catch (error) {
       console.error('Failed to start implementation:', error);
+
+      // Nothing was started, so put the statuses back and let the plan be started again
+      if (!agentRunCreated) {
+        const planIndex = this.plans.findIndex(p => p.id === planId);
+        if (planIndex !== -1) {
+          this.plans[planIndex].implementation_status = previousImplementationStatus;
+          await this.saveToStorage('PLANS');
+        }
+        await this.updateRequirement(requirement.id, { status: previousRequirementStatus });
+      }
+
       throw new Error('Failed to start implementation');
     }
   }
@@ -502,85 +555,347 @@ Please implement this plan step by step, creating the necessary code changes, an
 `;
   }
 
-  // Poll for implementation completion
-  private async pollForImplementationCompletion(planId: string, agentRunId: number, organizationId: number): Promise<void> {
-    const maxAttempts = 60; // 10 minutes with 10-second intervals
-    let attempts = 0;
+  // Track an agent run so its status changes are routed back to the plan, with direct checks as a safety net
+  private async watchAgentRun(agentRun: AgentRunResponse, organizationId: number, planId: string, kind: MonitoredRunKind): Promise<void> {
+    const run: MonitoredRun = { planId, kind, organizationId, startedAt: Date.now() };
+    this.monitoredRuns.set(agentRun.id, run);
+    await this.saveToStorage('MONITORED_RUNS');
+    await getAgentRunCache().addToTracking(organizationId, agentRun);
+
+    // Check right away rather than waiting out the monitor's current backoff
+    const backgroundMonitoring = getBackgroundMonitoringService();
+    if (!backgroundMonitoring.isMonitoring()) {
+      backgroundMonitoring.start();
+    } else {
+      backgroundMonitoring.wake();
+    }
+
+    this.scheduleSafetyNetCheck(agentRun.id, run);
+  }
+
+  // Pick up stored runs that aren't being watched yet. Each gets a safety-net check for whatever is left of
+  // its delay, since the monitor may have seen its final status change before it was restored
+  private resumeMonitoredRuns(records: MonitoredRunRecord[]): void {
+    let resumed = 0;
+    records.forEach(({ agentRunId, ...run }) => {
+      if (this.monitoredRuns.has(agentRunId) || this.settlingRuns.has(agentRunId) || !this.isActiveAgentRun(agentRunId, run)) {
+        return;
+      }
+      this.monitoredRuns.set(agentRunId, run);
+      const remaining = Math.max(run.startedAt + SAFETY_NET_DELAYS[run.kind] - Date.now(), 0);
+      this.scheduleSafetyNetCheck(agentRunId, run, remaining);
+      resumed++;
+    });
+
+    const backgroundMonitoring = getBackgroundMonitoringService();
+    if (resumed > 0 && !backgroundMonitoring.isMonitoring()) {
+      backgroundMonitoring.start();
+    }
+  }
+
+  // Whether a run is still the one its plan is waiting on; a superseded plan run mustn't settle the requirement
+  private isActiveAgentRun(agentRunId: number, run: MonitoredRun): boolean {
+    const plan = this.plans.find(p => p.id === run.planId);
+    if (!plan || plan.agent_run_id !== agentRunId) {
+      return false;
+    }
+
+    if (run.kind === 'implementation') {
+      return plan.implementation_status === ImplementationStatus.IN_PROGRESS;
+    }
+
+    const requirement = this.requirements.find(r => r.id === plan.requirement_id);
+    return !!requirement
+      && requirement.status === RequirementStatus.PLANNING
+      && !!requirement.plan
+      && requirement.plan.id === plan.id;
+  }
+
+  // Route agent run status changes to the plan they belong to
+  private async handleAgentRunStatusChange(change: AgentRunStatusChange): Promise<void> {
+    this.sweepMonitoredRuns();
 
-    const poll = async () => {
+    const status = change.newStatus.toLowerCase();
+    const succeeded = SUCCESS_STATUSES.includes(status);
+    if (!succeeded && !FAILURE_STATUSES.includes(status)) {
+      return;
+    }
+
+    const run = this.claimAgentRun(change.agentRunId);
+    if (!run) {
+      return;
+    }
+
+    try {
+      if (succeeded) {
+        await this.finishAgentRun(run, change.organizationId, change.agentRunId, change.result);
+      } else {
+        await this.failAgentRun(run);
+      }
+    } finally {
+      await this.releaseAgentRun(change.agentRunId);
+    }
+  }
+
+  // Check a run directly in case its status change event never arrives, and again later while it's still going
+  private scheduleSafetyNetCheck(agentRunId: number, run: MonitoredRun, delay = SAFETY_NET_DELAYS[run.kind]): void {
+    const { kind, organizationId } = run;
+    const timer = setTimeout(async () => {
+      this.safetyNetTimers.delete(agentRunId);
+      this.sweepMonitoredRuns();
+
+      if (this.monitoredRuns.get(agentRunId) !== run) {
+        return; // Already handled by a status change event, or expired
+      }
+
+      let status = '';
+      let result: string | undefined;
       try {
-        const apiClient = getAPIClient();
-        const agentRun = await apiClient.getAgentRun(organizationId, agentRunId);
-
-        if (agentRun.status === 'completed') {
-          // Update plan status
-          const planIndex = this.plans.findIndex(p => p.id === planId);
-          if (planIndex !== -1) {
-            this.plans[planIndex].implementation_status = ImplementationStatus.PR_CREATED;
-            this.plans[planIndex].pr_url = 'https://github.com/example/repo/pull/123'; // This would be extracted from agent run
-            
-            const requirement = this.requirements.find(r => r.id === this.plans[planIndex].requirement_id);
-            if (requirement) {
-              await this.updateRequirement(requirement.id, { status: RequirementStatus.COMPLETED });
-              
-              // Add notification
-              await this.addNotification(requirement.project_id, {
-                type: NotificationType.IMPLEMENTATION_COMPLETED,
-                title: 'Implementation Complete',
-                message: `Implementation for "${requirement.text}" has been completed and a PR has been created.`,
-                data: { pr_url: this.plans[planIndex].pr_url }
-              });
-            }
-
-            await this.saveToStorage();
-
-            await showToast({
-              style: Toast.Success,
-              title: 'Implementation Complete',
-              message: 'Your feature has been implemented and a PR has been created',
-            });
-          }
-        } else if (agentRun.status === 'failed') {
-          throw new Error('Implementation failed');
-        } else if (attempts < maxAttempts) {
-          attempts++;
-          setTimeout(poll, 10000); // Poll every 10 seconds
+        const agentRun = await getAPIClient().getAgentRun(organizationId, agentRunId);
+        status = (agentRun.status || '').toLowerCase();
+        result = agentRun.result;
+      } catch (error) {
+        console.warn(`Failed to check ${kind} agent run ${agentRunId}, will retry:`, error);
+      }
+
+      const succeeded = SUCCESS_STATUSES.includes(status);
+      if (!succeeded && !FAILURE_STATUSES.includes(status)) {
+        // Still going (or the check failed); leave it to the monitor and check again later
+        if (this.monitoredRuns.get(agentRunId) === run) {
+          this.scheduleSafetyNetCheck(agentRunId, run);
+        }
+        return;
+      }
+
+      // A status change event may have handled the run while it was being fetched
+      if (!this.claimAgentRun(agentRunId)) {
+        return;
+      }
+
+      try {
+        // Logs are only read once the run has succeeded
+        if (succeeded) {
+          await this.finishAgentRun(run, organizationId, agentRunId, result);
         } else {
-          throw new Error('Implementation timed out');
+          await this.failAgentRun(run);
         }
       } catch (error) {
-        console.error('Error polling for implementation completion:', error);
-        
-        // Update plan with error
-        const planIndex = this.plans.findIndex(p => p.id === planId);
-        if (planIndex !== -1) {
-          this.plans[planIndex].implementation_status = ImplementationStatus.FAILED;
-          
-          const requirement = this.requirements.find(r => r.id === this.plans[planIndex].requirement_id);
-          if (requirement) {
-            await this.updateRequirement(requirement.id, { status: RequirementStatus.FAILED });
-            
-            // Add notification
-            await this.addNotification(requirement.project_id, {
-              type: NotificationType.IMPLEMENTATION_FAILED,
-              title: 'Implementation Failed',
-              message: `Implementation for "${requirement.text}" has failed.`,
-            });
-          }
-
-          await this.saveToStorage();
-        }
+        console.error(`Error recording ${kind} completion:`, error);
+      } finally {
+        await this.releaseAgentRun(agentRunId);
+      }
+    }, delay);
+
+    this.safetyNetTimers.set(agentRunId, timer);
+  }
+
+  // Take a run out of monitoring before its outcome is recorded, so an event and the safety-net
+  // check that land together don't both handle it. Must be called before the first await
+  private claimAgentRun(agentRunId: number): MonitoredRun | undefined {
+    const run = this.monitoredRuns.get(agentRunId);
+    if (run) {
+      this.forgetAgentRun(agentRunId);
+      this.settlingRuns.set(agentRunId, run);
+    }
+    return run;
+  }
+
+  // Drop a claimed run from storage once its outcome has been recorded
+  private async releaseAgentRun(agentRunId: number): Promise<void> {
+    this.settlingRuns.delete(agentRunId);
+    try {
+      await this.saveToStorage('MONITORED_RUNS');
+    } catch (error) {
+      console.error(`Failed to stop tracking agent run ${agentRunId}:`, error);
+    }
+  }
+
+  // Stop watching a run, cancelling its safety-net check
+  private forgetAgentRun(agentRunId: number): void {
+    this.monitoredRuns.delete(agentRunId);
+
+    const timer = this.safetyNetTimers.get(agentRunId);
+    if (timer) {
+      clearTimeout(timer);
+      this.safetyNetTimers.delete(agentRunId);
+    }
+  }
+
+  // Fail runs that are too old to still be waiting on
+  private sweepMonitoredRuns(): void {
+    const cutoff = Date.now() - MONITORED_RUN_TTL;
+    const expired: number[] = [];
+    this.monitoredRuns.forEach((run, agentRunId) => {
+      if (!(run.startedAt > cutoff)) {
+        expired.push(agentRunId);
+      }
+    });
+    expired.forEach(agentRunId => this.expireAgentRun(agentRunId));
+  }
+
+  // Mark a run that never reported a final status as failed
+  private async expireAgentRun(agentRunId: number): Promise<void> {
+    const run = this.claimAgentRun(agentRunId);
+    if (!run) {
+      return;
+    }
+
+    console.warn(`Agent run ${agentRunId} did not finish within ${MONITORED_RUN_TTL / (60 * 60 * 1000)} hours`);
+    try {
+      await this.failAgentRun(run);
+    } catch (error) {
+      console.error(`Error recording ${run.kind} expiry:`, error);
+    } finally {
+      await this.releaseAgentRun(agentRunId);
+    }
+  }
 
-        await showToast({
-          style: Toast.Failure,
+  // Record the output of a successfully finished run
+  private async finishAgentRun(run: MonitoredRun, organizationId: number, agentRunId: number, result?: string): Promise<void> {
+    if (run.kind === 'plan') {
+      const planContent = await this.extractPlanContent(organizationId, agentRunId, result);
+      await this.completePlan(run.planId, planContent);
+    } else {
+      const prUrl = await this.findImplementationPrUrl(organizationId, agentRunId, result);
+      await this.completeImplementation(run.planId, prUrl);
+    }
+  }
+
+  // Record a failed run
+  private async failAgentRun(run: MonitoredRun): Promise<void> {
+    if (run.kind === 'plan') {
+      await this.failPlan(run.planId);
+    } else {
+      await this.failImplementation(run.planId);
+    }
+  }
+
+  // Store a generated plan and mark its requirement as planned
+  private async completePlan(planId: string, planContent: string): Promise<void> {
+    const planIndex = this.plans.findIndex(p => p.id === planId);
+    if (planIndex === -1) {
+      return;
+    }
+
+    this.plans[planIndex] = {
+      ...this.plans[planIndex],
+      content: planContent,
+      original_content: planContent,
+      updated_at: new Date().toISOString()
+    };
+    await this.saveToStorage('PLANS');
+
+    // Update requirement status
+    const requirement = this.requirements.find(r => r.id === this.plans[planIndex].requirement_id);
+    if (requirement) {
+      await this.updateRequirement(requirement.id, { 
+        status: RequirementStatus.PLANNED,
+        plan: this.plans[planIndex]
+      });
+    }
+
+    await showToast({
+      style: Toast.Success,
+      title: 'Plan Generated',
+      message: 'Your implementation plan is ready for review',
+    });
+  }
+
+  // Mark plan generation as failed so the requirement can be planned again
+  private async failPlan(planId: string): Promise<void> {
+    const planIndex = this.plans.findIndex(p => p.id === planId);
+    if (planIndex !== -1) {
+      this.plans[planIndex] = {
+        ...this.plans[planIndex],
+        content: 'Failed to generate plan. Please try again.',
+        updated_at: new Date().toISOString()
+      };
+      await this.saveToStorage('PLANS');
+
+      const requirement = this.requirements.find(r => r.id === this.plans[planIndex].requirement_id);
+      if (requirement) {
+        await this.updateRequirement(requirement.id, { status: RequirementStatus.DRAFT });
+      }
+    }
+
+    await showToast({
+      style: Toast.Failure,
+      title: 'Plan Generation Failed',
+      message: 'Failed to generate implementation plan',
+    });
+  }
+
+  // Find the PR URL of a finished implementation run, falling back to its logs
+  private async findImplementationPrUrl(organizationId: number, agentRunId: number, result?: string): Promise<string | undefined> {
+    const prUrl = extractPrUrl(result);
+    if (prUrl) {
+      return prUrl;
+    }
+
+    try {
+      return await getAPIClient().findInAgentRunLogs(organizationId, agentRunId, extractPrUrlFromLogs, LOG_PAGE_SIZE);
+    } catch (error) {
+      console.warn(`Failed to read logs for agent run ${agentRunId}:`, error);
+      return undefined;
+    }
+  }
+
+  // Mark an implementation as done and record its PR
+  private async completeImplementation(planId: string, prUrl?: string): Promise<void> {
+    const planIndex = this.plans.findIndex(p => p.id === planId);
+    if (planIndex === -1) {
+      return;
+    }
+
+    this.plans[planIndex].implementation_status = ImplementationStatus.PR_CREATED;
+    this.plans[planIndex].pr_url = prUrl;
+    await this.saveToStorage('PLANS');
+
+    const requirement = this.requirements.find(r => r.id === this.plans[planIndex].requirement_id);
+    if (requirement) {
+      await this.updateRequirement(requirement.id, { status: RequirementStatus.COMPLETED });
+
+      // Add notification
+      await this.addNotification(requirement.project_id, {
+        type: NotificationType.IMPLEMENTATION_COMPLETED,
+        title: 'Implementation Complete',
+        message: `Implementation for "${requirement.text}" has been completed and a PR has been created.`,
+        data: { pr_url: prUrl }
+      });
+    }
+
+    await showToast({
+      style: Toast.Success,
+      title: 'Implementation Complete',
+      message: 'Your feature has been implemented and a PR has been created',
+    });
+  }
+
+  // Mark an implementation as failed
+  private async failImplementation(planId: string): Promise<void> {
+    const planIndex = this.plans.findIndex(p => p.id === planId);
+    if (planIndex !== -1) {
+      this.plans[planIndex].implementation_status = ImplementationStatus.FAILED;
+      await this.saveToStorage('PLANS');
+
+      const requirement = this.requirements.find(r => r.id === this.plans[planIndex].requirement_id);
+      if (requirement) {
+        await this.updateRequirement(requirement.id, { status: RequirementStatus.FAILED });
+
+        // Add notification
+        await this.addNotification(requirement.project_id, {
+          type: NotificationType.IMPLEMENTATION_FAILED,
           title: 'Implementation Failed',
-          message: 'Failed to implement the plan',
+          message: `Implementation for "${requirement.text}" has failed.`,
         });
       }
-    };
+    }
 
-    // Start polling after a short delay
-    setTimeout(poll, 5000);
+    await showToast({
+      style: Toast.Failure,
+      title: 'Implementation Failed',
+      message: 'Failed to implement the plan',
+    });
   }
 
   // Add notification
@@ -594,7 +909,7 @@ Please implement this plan step by step, creating the necessary code changes, an
     };
 
     this.notifications.push(newNotification);
-    await this.saveToStorage();
+    await this.saveToStorage('NOTIFICATIONS');
 
     return newNotification;
   }
@@ -604,7 +919,7 @@ Please implement this plan step by step, creating the necessary code changes, an
     const notificationIndex = this.notifications.findIndex(n => n.id === id);
     if (notificationIndex !== -1) {
       this.notifications[notificationIndex].read = true;
-      await this.saveToStorage();
+      await this.saveToStorage('NOTIFICATIONS');
     }
   }
 
@@ -635,5 +950,8 @@ export function getProjectService(): ProjectService {
 
 // Reset service (useful for testing)
 export function resetProjectService(): void {
+  if (projectService) {
+    projectService.dispose();
+  }
   projectService = null;
 }
@@ -3,7 +3,7 @@ import { Cache } from "../utils/webCache";
 import { AgentRunResponse, AgentRunStatus, TrackedAgentRun, AgentRunStatusChange } from "../api/types";
 import { getAPIClient } from "../api/client";
 import {
-  AgentRunCacheEntry,
+  AgentRunCacheSnapshot,
   CacheMetadata,
   CACHE_KEYS,
   CACHE_NAMESPACES,
@@ -13,6 +13,19 @@ import {
   TrackedAgentRunCacheEntry,
 } from "./cacheTypes";
 
+// Extracts the organization ID from a tracked run cache key
+const TRACKED_RUN_KEY_PATTERN = /tracked-runs-org-(\d+)-/;
+
+// Statuses after which a tracked run will not change again
+const COMPLETED_STATUSES: string[] = [
+  AgentRunStatus.COMPLETE,
+  AgentRunStatus.ERROR,
+  AgentRunStatus.CANCELLED,
+  AgentRunStatus.TIMEOUT,
+  AgentRunStatus.MAX_ITERATIONS_REACHED,
+  AgentRunStatus.OUT_OF_TOKENS,
+];
+
 export class AgentRunCache {
   private cache: Cache;
   private metadata: CacheMetadata;
@@ -41,18 +54,20 @@ export class AgentRunCache {
     }
 
     try {
-      const entries: AgentRunCacheEntry[] = JSON.parse(cached);
-      const now = new Date();
-      
-      // Filter out expired entries and return data
-      return entries
-        .filter(entry => {
-          if (entry.expiresAt) {
-            return new Date(entry.expiresAt) > now;
-          }
-          return true;
-        })
-        .map(entry => entry.data)
+      const snapshot: AgentRunCacheSnapshot = JSON.parse(cached);
+
+      // Caches written in the old per-run entry format are treated as empty and refilled on next sync
+      if (!snapshot || !Array.isArray(snapshot.data)) {
+        return [];
+      }
+
+      // The whole snapshot expires at once
+      if (snapshot.expiresAt && new Date(snapshot.expiresAt) <= new Date()) {
+        return [];
+      }
+
+      return snapshot.data
+        .slice()
         .sort((a, b) => new Date(b.created_at).getTime() - new Date(a.created_at).getTime());
     } catch (error) {
       console.error("Error parsing cached agent runs:", error);
@@ -76,16 +91,16 @@ export class AgentRunCache {
     const now = new Date();
     const config = CACHE_CONFIGS[CACHE_NAMESPACES.AGENT_RUNS];
     
-    const entries: AgentRunCacheEntry[] = agentRuns.map(run => ({
-      data: run,
+    // Metadata is identical for every run, so store it once rather than repeating it per entry
+    const snapshot: AgentRunCacheSnapshot = {
+      data: agentRuns,
       timestamp: now.toISOString(),
       expiresAt: new Date(now.getTime() + config.ttl).toISOString(),
       version: this.metadata.version,
       organizationId,
-      isPolling: this.shouldPollRun(run),
-    }));
+    };
 
-    this.cache.set(cacheKey, JSON.stringify(entries));
+    this.cache.set(cacheKey, JSON.stringify(snapshot));
     
     // Update metadata
     this.metadata.organizationSyncStatus[organizationId] = now.toISOString();
@@ -137,19 +152,17 @@ export class AgentRunCache {
       // For now, we'll implement a simple approach since the API doesn't have a list endpoint
       // In a real implementation, you might need to track agent run IDs separately
       const cachedRuns = await this.getAgentRuns(organizationId);
-      const updatedRuns: AgentRunResponse[] = [];
       
-      // Update existing runs that might have changed status
-      for (const cachedRun of cachedRuns) {
+      // Update existing runs that might have changed status, fetching them concurrently
+      const updatedRuns = await Promise.all(cachedRuns.map(async (cachedRun) => {
         try {
-          const updatedRun = await apiClient.getAgentRun(organizationId, cachedRun.id);
-          updatedRuns.push(updatedRun);
+          return await apiClient.getAgentRun(organizationId, cachedRun.id);
         } catch (error) {
           // If we can't fetch a run, keep the cached version
           console.warn(`Failed to update agent run ${cachedRun.id}:`, error);
-          updatedRuns.push(cachedRun);
+          return cachedRun;
         }
-      }
+      }));
 
       await this.setAgentRuns(organizationId, updatedRuns);
       await this.setSyncStatus(organizationId, SyncStatus.SUCCESS);
@@ -307,10 +320,9 @@ export class AgentRunCache {
     }
 
     const apiClient = getAPIClient();
-    const statusChanges: AgentRunStatusChange[] = [];
 
-    // Check each tracked run for status changes
-    for (const trackedRun of trackedRuns) {
+    // Check all tracked runs concurrently
+    const changes = await Promise.all(trackedRuns.map(async (trackedRun): Promise<AgentRunStatusChange | null> => {
       try {
         const currentRun = await apiClient.getAgentRun(organizationId, trackedRun.id);
         if (currentRun && currentRun.status !== trackedRun.lastKnownStatus) {
@@ -322,19 +334,21 @@ export class AgentRunCache {
             newStatus: currentRun.status || "UNKNOWN",
             timestamp: new Date().toISOString(),
             webUrl: currentRun.web_url || trackedRun.webUrl,
+            result: currentRun.result,
           };
 
-          statusChanges.push(change);
-
           // Update the tracked run with the new status
           await this.updateTrackedRunStatus(organizationId, trackedRun.id, currentRun.status);
+          return change;
         }
       } catch (error) {
         console.error(`Error checking status for run ${trackedRun.id}:`, error);
         // Continue with other runs even if one fails
       }
-    }
+      return null;
+    }));
 
+    const statusChanges = changes.filter((change): change is AgentRunStatusChange => change !== null);
     return statusChanges;
   }
 
@@ -364,17 +378,9 @@ export class AgentRunCache {
    */
   async cleanupCompletedRuns(organizationId: number): Promise<void> {
     const trackedRuns = await this.getTrackedRuns(organizationId);
-    const completedStatuses = [
-      AgentRunStatus.COMPLETE,
-      AgentRunStatus.ERROR,
-      AgentRunStatus.CANCELLED,
-      AgentRunStatus.TIMEOUT,
-      AgentRunStatus.MAX_ITERATIONS_REACHED,
-      AgentRunStatus.OUT_OF_TOKENS,
-    ];
 
     for (const trackedRun of trackedRuns) {
-      if (trackedRun.lastKnownStatus && completedStatuses.includes(trackedRun.lastKnownStatus as AgentRunStatus)) {
+      if (trackedRun.lastKnownStatus && COMPLETED_STATUSES.includes(trackedRun.lastKnownStatus)) {
         // Check if it's been completed for more than 24 hours
         const completedTime = new Date(trackedRun.addedAt).getTime();
         const now = new Date().getTime();
@@ -421,7 +427,7 @@ export class AgentRunCache {
    */
   private async addKeyToTracking(key: string): Promise<void> {
     // Extract the organization ID from the key
-    const match = key.match(/tracked-runs-org-(\d+)-/);
+    const match = TRACKED_RUN_KEY_PATTERN.exec(key);
     if (!match) {
       console.error(`Invalid key format for tracking: ${key}`);
       return;
@@ -24,10 +24,9 @@ export interface CacheEntry<T> {
   version: string;
 }
 
-export interface AgentRunCacheEntry extends CacheEntry<AgentRunResponse> {
+// All cached runs for an organization, sharing a single set of cache metadata
+export interface AgentRunCacheSnapshot extends CacheEntry<AgentRunResponse[]> {
   organizationId: number;
-  isPolling?: boolean;
-  lastPolled?: string;
 }
 
 export interface OrganizationCacheEntry extends CacheEntry<OrganizationResponse> {
@@ -0,0 +1,66 @@
+/**
+ * Helpers for pulling structured data out of agent run output
+ */
+
+import { LogEntry } from "../api/types";
+
+// Compiled once rather than per message
+const PR_URL_PATTERN = /https:\/\/github\.com\/[^/\s]+\/[^/\s]+\/pull\/\d+/;
+const GITHUB_URL_PREFIX = "https://github.com/";
+// Case-insensitive test, so messages don't need to be lower-cased (and copied) first
+const PLAN_HINT_PATTERN = /implementation_plan/i;
+
+/**
+ * Extract the first GitHub pull request URL from agent run output
+ *
+ * @param text Agent run result or log message
+ * @returns The pull request URL, or undefined if none was found
+ */
+export function extractPrUrl(text?: string | null): string | undefined {
+  // Cheap substring check first; most messages contain no GitHub URL at all
+  if (typeof text !== "string" || text.indexOf(GITHUB_URL_PREFIX) === -1) {
+    return undefined;
+  }
+
+  const match = PR_URL_PATTERN.exec(text);
+  return match ? match[0] : undefined;
+}
+
+/**
+ * Find the first GitHub pull request URL mentioned in agent run logs
+ *
+ * @param logs Agent run log entries
+ * @returns The pull request URL, or undefined if none was found
+ */
+export function extractPrUrlFromLogs(logs: LogEntry[]): string | undefined {
+  for (const entry of logs) {
+    const prUrl = extractPrUrl(entry.message);
+    if (prUrl) {
+      return prUrl;
+    }
+  }
+  return undefined;
+}
+
+/**
+ * Find the generated implementation plan in agent run logs
+ *
+ * The prompt and the agent's early reasoning mention the plan too, so the latest matching
+ * message is taken as the final plan.
+ *
+ * @param logs Agent run log entries, oldest first
+ * @returns The last log message containing the plan, or undefined if none was found
+ */
+export function extractPlanFromLogs(logs: LogEntry[]): string | undefined {
+  for (let i = logs.length - 1; i >= 0; i--) {
+    const entry = logs[i];
+    // Some entries only carry metadata
+    if (typeof entry.message !== "string") {
+      continue;
+    }
+    if (PLAN_HINT_PATTERN.test(entry.message)) {
+      return entry.message;
+    }
+  }
+  return undefined;
+}
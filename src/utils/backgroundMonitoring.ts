@@ -1,10 +1,19 @@
 import { getAgentRunCache } from "../storage/agentRunCache";
 import { getNotificationManager } from "./notifications";
+import { AgentRunStatusChange } from "../api/types";
+
+export type StatusChangeListener = (change: AgentRunStatusChange) => void | Promise<void>;
 
 class BackgroundMonitoringService {
-  private intervalId: NodeJS.Timeout | null = null;
+  private timeoutId: NodeJS.Timeout | null = null;
   private isRunning = false;
-  private readonly MONITORING_INTERVAL = 30000; // 30 seconds
+  private runId = 0;
+  private listeners = new Set<StatusChangeListener>();
+  private readonly MIN_INTERVAL = 2000; // 2 seconds
+  private readonly MAX_INTERVAL = 30000; // 30 seconds
+  private readonly BACKOFF_FACTOR = 1.5;
+  private readonly JITTER = 0.2; // +/- 20%
+  private currentInterval = this.MIN_INTERVAL;
 
   /**
    * Start background monitoring
@@ -22,31 +31,98 @@ class BackgroundMonitoringService {
     const notificationManager = getNotificationManager();
     await notificationManager.initialize();
 
-    // Run immediately
-    this.checkForStatusChanges();
-
-    // Then run every 30 seconds
-    this.intervalId = setInterval(() => {
-      this.checkForStatusChanges();
-    }, this.MONITORING_INTERVAL);
+    // Run immediately, then back off while nothing changes
+    this.currentInterval = this.MIN_INTERVAL;
+    this.runId++;
+    this.runCheck(this.runId);
   }
 
   /**
    * Stop background monitoring
    */
   stop(): void {
-    if (this.intervalId) {
-      clearInterval(this.intervalId);
-      this.intervalId = null;
+    if (this.timeoutId) {
+      clearTimeout(this.timeoutId);
+      this.timeoutId = null;
     }
     this.isRunning = false;
     console.log("Background monitoring stopped");
   }
 
+  /**
+   * Run one check and schedule the next one
+   *
+   * Checks repeat quickly after a status change and slow down towards MAX_INTERVAL
+   * while nothing changes, with jitter so clients don't poll in lockstep.
+   */
+  private async runCheck(runId: number): Promise<void> {
+    this.timeoutId = null;
+    const hadChanges = await this.checkForStatusChanges();
+
+    // Stopped or restarted while the check was in flight
+    if (!this.isRunning || runId !== this.runId) {
+      return;
+    }
+
+    this.currentInterval = hadChanges
+      ? this.MIN_INTERVAL
+      : Math.min(this.currentInterval * this.BACKOFF_FACTOR, this.MAX_INTERVAL);
+
+    const jitter = 1 + (Math.random() * 2 - 1) * this.JITTER;
+    this.timeoutId = setTimeout(() => this.runCheck(runId), this.currentInterval * jitter);
+  }
+
+  /**
+   * Cut the current wait short and check right away, e.g. when a new run starts being tracked
+   */
+  wake(): void {
+    if (!this.isRunning) {
+      return;
+    }
+
+    this.currentInterval = this.MIN_INTERVAL;
+
+    // If no check is scheduled, one is already in flight and the next will follow shortly
+    if (this.timeoutId) {
+      clearTimeout(this.timeoutId);
+      this.runCheck(this.runId);
+    }
+  }
+
+  /**
+   * Subscribe to status changes detected by the monitor
+   *
+   * @returns Function that removes the listener
+   */
+  onStatusChange(listener: StatusChangeListener): () => void {
+    this.listeners.add(listener);
+    return () => {
+      this.listeners.delete(listener);
+    };
+  }
+
+  /**
+   * Deliver a status change to every subscribed listener
+   */
+  private async emitStatusChange(change: AgentRunStatusChange): Promise<void> {
+    // Deliver concurrently so one slow listener doesn't hold up the others
+    await Promise.all(Array.from(this.listeners).map(async (listener) => {
+      try {
+        await listener(change);
+      } catch (error) {
+        console.error(`Error in status change listener for agent run ${change.agentRunId}:`, error);
+      }
+    }));
+  }
+
   /**
    * Check for status changes across all tracked organizations
+   *
+   * @returns True if any tracked run changed status
    */
-  private async checkForStatusChanges(): Promise<void> {
+  private async checkForStatusChanges(): Promise<boolean> {
+    let hadChanges = false;
+
     try {
       const cache = getAgentRunCache();
       const notificationManager = getNotificationManager();
@@ -55,23 +131,26 @@ class BackgroundMonitoringService {
       const trackedOrganizations = await cache.getTrackedOrganizations();
       
       if (trackedOrganizations.length === 0) {
-        return; // No organizations to monitor
+        return false; // No organizations to monitor
       }
 
       console.log(`Monitoring ${trackedOrganizations.length} organizations for status changes`);
 
-      // Check each organization for status changes
-      for (const organizationId of trackedOrganizations) {
+      // Check all organizations for status changes concurrently
+      await Promise.all(trackedOrganizations.map(async (organizationId) => {
         try {
           const statusChanges = await cache.checkForStatusChanges(organizationId);
           
           if (statusChanges.length > 0) {
+            hadChanges = true;
             console.log(`Found ${statusChanges.length} status changes for org ${organizationId}`);
             
-            // Send notifications for each status change
-            for (const change of statusChanges) {
+            // Send notifications and events for all status changes at once. Listeners can do slow
+            // work (log scans, storage writes), so they don't hold up the next poll
+            await Promise.all(statusChanges.map(async (change) => {
               await notificationManager.notifyStatusChange(change);
-            }
+              void this.emitStatusChange(change);
+            }));
           }
 
           // Cleanup completed runs (optional, runs once per check)
@@ -81,11 +160,13 @@ class BackgroundMonitoringService {
           console.error(`Error monitoring organization ${organizationId}:`, error);
           // Continue with other organizations even if one fails
         }
-      }
+      }));
 
     } catch (error) {
       console.error("Error in background monitoring:", error);
     }
+
+    return hadChanges;
   }
 
   /**
@@ -0,0 +1,49 @@
+/**
+ * Utilities for limiting how much async work runs at once
+ */
+
+/**
+ * Counting semaphore that caps the number of tasks running concurrently
+ */
+export class Semaphore {
+  private limit: number;
+  private active = 0;
+  private waiting: Array<() => void> = [];
+
+  constructor(limit: number) {
+    this.limit = limit;
+  }
+
+  /**
+   * Run a task once a slot is free
+   *
+   * @param task The async work to run
+   * @returns Promise with the task's result
+   */
+  async run<T>(task: () => Promise<T>): Promise<T> {
+    await this.acquire();
+    try {
+      return await task();
+    } finally {
+      this.release();
+    }
+  }
+
+  private acquire(): Promise<void> {
+    if (this.active < this.limit) {
+      this.active++;
+      return Promise.resolve();
+    }
+    return new Promise(resolve => this.waiting.push(resolve));
+  }
+
+  private release(): void {
+    // Hand the slot straight to the next waiting task, if any
+    const next = this.waiting.shift();
+    if (next) {
+      next();
+    } else {
+      this.active--;
+    }
+  }
+}
@@ -38,6 +38,7 @@ async function fetchWithTimeout(
 ): Promise<Response> {
   const controller = new AbortController();
   const timeoutId = setTimeout(() => controller.abort(), timeout);
+  const onAbort = () => controller.abort();
   
   try {
     // Check if we're online before attempting fetch
@@ -45,10 +46,18 @@ async function fetchWithTimeout(
       throw new Error('No internet connection. Please check your network and try again.');
     }
     
-    // Add signal to options if not already present
+    // Abort on the caller's signal as well as on timeout
+    if (options.signal) {
+      if (options.signal.aborted) {
+        controller.abort();
+      } else {
+        options.signal.addEventListener('abort', onAbort);
+      }
+    }
+    
     const fetchOptions = {
       ...options,
-      signal: options.signal || controller.signal
+      signal: controller.signal
     };
     
     console.log(`🌐 Fetching ${url} with timeout ${timeout}ms`);
@@ -58,6 +67,9 @@ async function fetchWithTimeout(
   } catch (error) {
     // Enhance error message for specific error types
     if (error instanceof DOMException && error.name === 'AbortError') {
+      if (options.signal && options.signal.aborted) {
+        throw new Error('Request was cancelled');
+      }
       throw new Error(`Request timed out after ${timeout}ms`);
     }
     
@@ -73,6 +85,9 @@ async function fetchWithTimeout(
     throw error;
   } finally {
     clearTimeout(timeoutId);
+    if (options.signal) {
+      options.signal.removeEventListener('abort', onAbort);
+    }
   }
 }
 
@@ -143,17 +158,15 @@ export async function fetchWithRetry(
     } catch (error) {
       lastError = error instanceof Error ? error : new Error(String(error));
       
-      // Don't retry for certain errors unless explicitly enabled
-      const isNetworkError = 
-        lastError.message.includes('Failed to fetch') ||
-        lastError.message.includes('Network error') ||
-        lastError.message.includes('timeout');
-      
+      // A thrown error means the request may or may not have reached the server. Browsers word
+      // network failures differently ('Failed to fetch', 'NetworkError when attempting to fetch
+      // resource.', 'Load failed'), so when network retries are off, none of them is retried
       if (
+        !retryOnNetworkError ||
         lastError.message.includes('No internet connection') ||
+        lastError.message.includes('cancelled') ||
         lastError.message.includes('CORS') ||
-        lastError.message.includes('incorrect API URL') ||
-        (isNetworkError && !retryOnNetworkError)
+        lastError.message.includes('incorrect API URL')
       ) {
         throw lastError;
       }
@@ -65,8 +65,11 @@ class WebCache implements WebCacheInterface {
 
   async set(key: string, value: string): Promise<void> {
     try {
-      await this.enforceCapacity();
       const fullKey = this.getFullKey(key);
+      // Overwriting an existing entry can't exceed capacity, so skip the full key scan
+      if (localStorage.getItem(fullKey) === null) {
+        await this.enforceCapacity();
+      }
       localStorage.setItem(fullKey, value);
     } catch (error) {
       console.error(`Error setting cache item: ${key}`, error);